@@ -0,0 +1,31 @@
+'''Optional numba acceleration for numeric kernels in flaml.tune.
+
+numba is imported lazily, the first time a kernel is requested, because
+importing it adds noticeable time to ``import flaml``. The ``get_*_kernel``
+helpers compile their kernel on first use and return None when numba is
+not installed.
+'''
+from functools import lru_cache
+
+import numpy as np
+
+
+@lru_cache(maxsize=None)
+def get_quantize_kernel():
+    '''Returns a numba-compiled function ``kernel(values, q)`` which rounds
+    each element of the 1-d float array ``values`` to an integer increment
+    of ``q`` in place, or None if numba is not installed.
+    The results are identical to ``np.round(values / q) * q``.
+    '''
+    try:
+        import numba
+    except ImportError:
+        return None
+    prange = numba.prange
+
+    @numba.njit(parallel=True, cache=True)
+    def quantize_inplace(values, q):
+        for i in prange(values.shape[0]):
+            values[i] = np.rint(values[i] / q) * q
+
+    return quantize_inplace
@@ -18,16 +18,36 @@ This source file is included here because ray does not fully support Windows.
 Copyright (c) Microsoft Corporation.
 '''
 import logging
-import random
-from copy import copy
+import math
+from functools import lru_cache
 from inspect import signature
 from math import isclose
 from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 
 import numpy as np
 
+from ._numba_utils import get_quantize_kernel
+
 logger = logging.getLogger(__name__)
 
+# Scalar (size=1) samples are affine transforms of one standard-uniform
+# deviate from np.random.random_sample(), which has far less call overhead
+# than np.random.uniform() and friends. The deviates are deliberately not
+# buffered across calls, and batches are drawn from np.random as well:
+# using only the global np.random state keeps np.random.seed()/set_state()
+# reproducible. Integer and categorical batches use the same transform of
+# np.random.random_sample(size), which is cheaper than np.random.randint().
+
+# Minimum batch size for which Quantized uses the numba kernel, if available.
+_numba_quantize_min_size = 1024
+
+
+@lru_cache(maxsize=None)
+def _slot_descriptors(cls) -> tuple:
+    """Member descriptors of all ``__slots__`` declared along the MRO."""
+    return tuple(klass.__dict__[name] for klass in cls.__mro__
+                 for name in klass.__dict__.get("__slots__", ()))
+
 
 class Domain:
     """Base class to specify a type and valid range to sample parameters from.
@@ -38,34 +58,77 @@ class Domain:
     allow specification of specific samplers (e.g. ``uniform()`` or
     ``loguniform()``).
     """
-    sampler = None
     default_sampler_cls = None
+    # plain callable equivalent to ``cast``, used on sampling paths to
+    # avoid a method call per value
+    _cast = staticmethod(lambda value: value)
+    # _default_sampler_cached holds the default sampler created on first use;
+    # _sample_fn is the bound sample method of the effective sampler;
+    # _domain_str caches the domain_str of subclasses.
+    # __dict__ keeps other attributes settable, as before __slots__; it is
+    # only allocated once one is set. Subclasses may not call __init__, so
+    # the slots here are read with getattr.
+    __slots__ = ("sampler", "_default_sampler_cached", "_sample_fn",
+                 "_domain_str", "__dict__")
+
+    def __init__(self):
+        self.sampler = None
+        self._default_sampler_cached = None
+        self._sample_fn = None
+        self._domain_str = None
 
     def cast(self, value):
         """Cast value to domain type"""
         return value
 
+    def _clone(self):
+        """Shallow copy, cheaper than ``copy.copy`` for builder methods."""
+        new = object.__new__(self.__class__)
+        for slot in _slot_descriptors(self.__class__):
+            try:
+                slot.__set__(new, slot.__get__(self))
+            except AttributeError:
+                # unset slot
+                pass
+        if self.__dict__:
+            new.__dict__.update(self.__dict__)
+        return new
+
     def set_sampler(self, sampler, allow_override=False):
-        if self.sampler and not allow_override:
+        if getattr(self, "sampler", None) and not allow_override:
             raise ValueError("You can only choose one sampler for parameter "
                              "domains. Existing sampler for parameter {}: "
                              "{}. Tried to add {}".format(
                                  self.__class__.__name__, self.sampler,
                                  sampler))
         self.sampler = sampler
+        self._default_sampler_cached = None
+        self._sample_fn = sampler.sample
 
     def get_sampler(self):
-        sampler = self.sampler
-        if not sampler:
-            sampler = self.default_sampler_cls()
+        sampler = getattr(self, "sampler", None) or \
+            getattr(self, "_default_sampler_cached", None)
+        if sampler is None:
+            sampler = self._default_sampler_cached = \
+                self.default_sampler_cls()
         return sampler
 
     def sample(self, spec=None, size=1):
-        sampler = self.get_sampler()
-        return sampler.sample(self, spec=spec, size=size)
+        sample_fn = getattr(self, "_sample_fn", None)
+        if sample_fn is None:
+            sample_fn = self._sample_fn = self.get_sampler().sample
+        return sample_fn(self, spec=spec, size=size)
+
+    def sample_batch(self, n: int):
+        """Draw ``n`` values in a single vectorized call.
+        Returns a numpy array already of the domain type, i.e., a float
+        array for ``Float`` and an int array for ``Integer`` (a list for
+        ``Categorical``), so values need no per-element ``cast``.
+        """
+        return self.get_sampler().sample_batch(self, n)
 
     def is_grid(self):
-        return isinstance(self.sampler, Grid)
+        return isinstance(getattr(self, "sampler", None), Grid)
 
     def is_function(self):
         return False
@@ -74,39 +137,69 @@ class Domain:
         """Returns True if `value` is a valid value in this domain."""
         raise NotImplementedError
 
+    def is_valid_batch(self, values: Sequence) -> np.ndarray:
+        """Returns a boolean mask marking the valid entries of `values`."""
+        return np.array([self.is_valid(value) for value in values],
+                        dtype=bool)
+
     @property
     def domain_str(self):
         return "(unknown)"
 
 
 class Sampler:
+    __slots__ = ()
+
     def sample(self,
                domain: Domain,
                spec: Optional[Union[List[Dict], Dict]] = None,
                size: int = 1):
         raise NotImplementedError
 
+    def sample_batch(self, domain: Domain, size: int):
+        raise NotImplementedError
+
 
 class BaseSampler(Sampler):
+    __slots__ = ()
+
     def __str__(self):
         return "Base"
 
 
 class Uniform(Sampler):
+    __slots__ = ()
+
     def __str__(self):
         return "Uniform"
 
 
 class LogUniform(Sampler):
+    __slots__ = ("base",)
+
     def __init__(self, base: float = 10):
         self.base = base
         assert self.base > 0, "Base has to be strictly greater than 0"
 
+    def _log_range(self, domain: Domain):
+        """Returns the natural log of the domain bounds, which the domain's
+        ``loguniform()`` precomputes.
+        Sampling uniformly in natural-log space and exponentiating is
+        equivalent to doing so in log ``base`` space, so ``base`` cancels.
+        """
+        bounds = domain._log_bounds
+        if bounds is None:
+            bounds = domain._log_bounds = (
+                math.log(domain.lower), math.log(domain.upper))
+        return bounds
+
     def __str__(self):
         return "LogUniform"
 
 
 class Normal(Sampler):
+    __slots__ = ("mean", "sd")
+
     def __init__(self, mean: float = 0., sd: float = 0.):
         self.mean = mean
         self.sd = sd
@@ -119,6 +212,7 @@ class Normal(Sampler):
 
 class Grid(Sampler):
     """Dummy sampler used for grid search"""
+    __slots__ = ()
 
     def sample(self,
                domain: Domain,
@@ -127,57 +221,107 @@ class Grid(Sampler):
         return RuntimeError("Do not call `sample()` on grid.")
 
 
-class Float(Domain):
+class _NumericDomain(Domain):
+    """Base class of ``Float`` and ``Integer``, whose ``lower`` and
+    ``upper`` bounds are properties so that the values cached from them
+    are recomputed when they are reassigned.
+    """
+    # bounded and low_cost_point are set by flaml.tune.space;
+    # _range is upper - lower (None if unbounded) and _log_bounds holds
+    # the natural log of (lower, upper) for log-uniform sampling
+    __slots__ = ("_lower", "_upper", "_range", "_log_bounds", "bounded",
+                 "low_cost_point")
+
+    @property
+    def lower(self):
+        return self._lower
+
+    @lower.setter
+    def lower(self, lower):
+        self._lower = lower
+        self._update_bounds()
+
+    @property
+    def upper(self):
+        return self._upper
+
+    @upper.setter
+    def upper(self, upper):
+        self._upper = upper
+        self._update_bounds()
+
+    def _update_bounds(self):
+        lower, upper = self._lower, self._upper
+        if lower is None or upper is None or not math.isfinite(upper - lower):
+            self._range = None
+        else:
+            self._range = upper - lower
+        self._log_bounds = None
+        self._domain_str = None
+
+
+class Float(_NumericDomain):
     class _Uniform(Uniform):
+        __slots__ = ()
+
         def sample(self,
                    domain: "Float",
                    spec: Optional[Union[List[Dict], Dict]] = None,
                    size: int = 1):
-            assert domain.lower > float("-inf"), \
-                "Uniform needs a lower bound"
-            assert domain.upper < float("inf"), \
-                "Uniform needs a upper bound"
-            items = np.random.uniform(domain.lower, domain.upper, size=size)
-            return items if len(items) > 1 else domain.cast(items[0])
+            if size == 1:
+                return float(
+                    domain._lower + domain._range * np.random.random_sample())
+            return self.sample_batch(domain, size)
+
+        def sample_batch(self, domain: "Float", size: int):
+            return np.random.uniform(domain._lower, domain._upper, size=size)
 
     class _LogUniform(LogUniform):
+        __slots__ = ()
+
         def sample(self,
                    domain: "Float",
                    spec: Optional[Union[List[Dict], Dict]] = None,
                    size: int = 1):
-            assert domain.lower > 0, \
-                "LogUniform needs a lower bound greater than 0"
-            assert 0 < domain.upper < float("inf"), \
-                "LogUniform needs a upper bound greater than 0"
-            logmin = np.log(domain.lower) / np.log(self.base)
-            logmax = np.log(domain.upper) / np.log(self.base)
+            if size == 1:
+                logmin, logmax = self._log_range(domain)
+                return math.exp(
+                    logmin + (logmax - logmin) * np.random.random_sample())
+            return self.sample_batch(domain, size)
 
-            items = self.base**(np.random.uniform(logmin, logmax, size=size))
-            return items if len(items) > 1 else domain.cast(items[0])
+        def sample_batch(self, domain: "Float", size: int):
+            logmin, logmax = self._log_range(domain)
+            items = np.random.uniform(logmin, logmax, size=size)
+            return np.exp(items, out=items)
 
     class _Normal(Normal):
+        __slots__ = ()
+
         def sample(self,
                    domain: "Float",
                    spec: Optional[Union[List[Dict], Dict]] = None,
                    size: int = 1):
-            assert not domain.lower or domain.lower == float("-inf"), \
-                "Normal sampling does not allow a lower value bound."
-            assert not domain.upper or domain.upper == float("inf"), \
-                "Normal sampling does not allow a upper value bound."
-            items = np.random.normal(self.mean, self.sd, size=size)
-            return items if len(items) > 1 else domain.cast(items[0])
+            if size == 1:
+                return float(np.random.normal(self.mean, self.sd))
+            return self.sample_batch(domain, size)
+
+        def sample_batch(self, domain: "Float", size: int):
+            return np.random.normal(self.mean, self.sd, size=size)
 
     default_sampler_cls = _Uniform
+    _cast = float
 
     def __init__(self, lower: Optional[float], upper: Optional[float]):
+        super().__init__()
         # Need to explicitly check for None
-        self.lower = lower if lower is not None else float("-inf")
-        self.upper = upper if upper is not None else float("inf")
+        self._lower = lower if lower is not None else float("-inf")
+        self._upper = upper if upper is not None else float("inf")
+        self._update_bounds()
 
     def cast(self, value):
         return float(value)
 
-    def uniform(self):
+    def _check_uniform_bounds(self):
         if not self.lower > float("-inf"):
             raise ValueError(
                 "Uniform requires a lower bound. Make sure to set the "
@@ -186,7 +330,17 @@ class Float(Domain):
             raise ValueError(
                 "Uniform requires a upper bound. Make sure to set the "
                 "`upper` parameter of `Float()`.")
-        new = copy(self)
+
+    def get_sampler(self):
+        if self.sampler is None and self._default_sampler_cached is None:
+            # the default sampler is uniform; check its bounds once here
+            # as uniform() does, since samples are not checked
+            self._check_uniform_bounds()
+        return super().get_sampler()
+
+    def uniform(self):
+        self._check_uniform_bounds()
+        new = self._clone()
         new.set_sampler(self._Uniform())
         return new
 
@@ -203,12 +357,21 @@ class Float(Domain):
                 f"Got: {self.lower}. Did you pass a variable that has "
                 "been log-transformed? If so, pass the non-transformed value "
                 "instead.")
-        new = copy(self)
+        new = self._clone()
+        new._log_bounds = (math.log(self.lower), math.log(self.upper))
         new.set_sampler(self._LogUniform(base))
         return new
 
     def normal(self, mean=0., sd=1.):
-        new = copy(self)
+        if self.lower and self.lower > float("-inf"):
+            raise ValueError(
+                "Normal sampling does not allow a lower value bound. "
+                f"Got: {self.lower}.")
+        if self.upper and self.upper < float("inf"):
+            raise ValueError(
+                "Normal sampling does not allow a upper value bound. "
+                f"Got: {self.upper}.")
+        new = self._clone()
         new.set_sampler(self._Normal(mean, sd))
         return new
 
@@ -224,59 +387,80 @@ class Float(Domain):
                 f"Your upper variable bound {self.upper} is not divisible by "
                 f"quantization factor {q}.")
 
-        new = copy(self)
+        new = self._clone()
         new.set_sampler(Quantized(new.get_sampler(), q), allow_override=True)
         return new
 
     def is_valid(self, value: float):
         return self.lower <= value <= self.upper
 
+    def is_valid_batch(self, values: Sequence) -> np.ndarray:
+        values = np.asarray(values)
+        return (values >= self.lower) & (values <= self.upper)
+
     @property
     def domain_str(self):
-        return f"({self.lower}, {self.upper})"
+        if self._domain_str is None:
+            self._domain_str = f"({self.lower}, {self.upper})"
+        return self._domain_str
 
 
-class Integer(Domain):
+class Integer(_NumericDomain):
     class _Uniform(Uniform):
+        __slots__ = ()
+
         def sample(self,
                    domain: "Integer",
                    spec: Optional[Union[List[Dict], Dict]] = None,
                    size: int = 1):
-            items = np.random.randint(domain.lower, domain.upper, size=size)
-            return items if len(items) > 1 else domain.cast(items[0])
+            if size == 1:
+                return int(domain._lower + int(
+                    domain._range * np.random.random_sample()))
+            return self.sample_batch(domain, size)
+
+        def sample_batch(self, domain: "Integer", size: int):
+            items = (domain._range * np.random.random_sample(size)).astype(int)
+            items += domain._lower
+            return items
 
     class _LogUniform(LogUniform):
+        __slots__ = ()
+
         def sample(self,
                    domain: "Integer",
                    spec: Optional[Union[List[Dict], Dict]] = None,
                    size: int = 1):
-            assert domain.lower > 0, \
-                "LogUniform needs a lower bound greater than 0"
-            assert 0 < domain.upper < float("inf"), \
-                "LogUniform needs a upper bound greater than 0"
-            logmin = np.log(domain.lower) / np.log(self.base)
-            logmax = np.log(domain.upper) / np.log(self.base)
-
-            items = self.base**(np.random.uniform(logmin, logmax, size=size))
-            items = np.round(items).astype(int)
-            return items if len(items) > 1 else domain.cast(items[0])
+            if size == 1:
+                logmin, logmax = self._log_range(domain)
+                return round(math.exp(
+                    logmin + (logmax - logmin) * np.random.random_sample()))
+            return self.sample_batch(domain, size)
+
+        def sample_batch(self, domain: "Integer", size: int):
+            logmin, logmax = self._log_range(domain)
+            items = np.random.uniform(logmin, logmax, size=size)
+            np.exp(items, out=items)
+            return np.round(items, out=items).astype(int)
 
     default_sampler_cls = _Uniform
+    _cast = int
 
     def __init__(self, lower, upper):
-        self.lower = lower
-        self.upper = upper
+        super().__init__()
+        self._lower = lower
+        self._upper = upper
+        self._update_bounds()
 
     def cast(self, value):
         return int(value)
 
     def quantized(self, q: int):
-        new = copy(self)
+        new = self._clone()
         new.set_sampler(Quantized(new.get_sampler(), q), allow_override=True)
         return new
 
     def uniform(self):
-        new = copy(self)
+        new = self._clone()
         new.set_sampler(self._Uniform())
         return new
 
@@ -293,35 +477,72 @@ class Integer(Domain):
                 f"Got: {self.lower}. Did you pass a variable that has "
                 "been log-transformed? If so, pass the non-transformed value "
                 "instead.")
-        new = copy(self)
+        new = self._clone()
+        new._log_bounds = (math.log(self.lower), math.log(self.upper))
         new.set_sampler(self._LogUniform(base))
         return new
 
     def is_valid(self, value: int):
         return self.lower <= value <= self.upper
 
+    def is_valid_batch(self, values: Sequence) -> np.ndarray:
+        values = np.asarray(values)
+        return (values >= self.lower) & (values <= self.upper)
+
     @property
     def domain_str(self):
-        return f"({self.lower}, {self.upper})"
+        if self._domain_str is None:
+            self._domain_str = f"({self.lower}, {self.upper})"
+        return self._domain_str
 
 
 class Categorical(Domain):
     class _Uniform(Uniform):
+        __slots__ = ()
+
         def sample(self,
                    domain: "Categorical",
                    spec: Optional[Union[List[Dict], Dict]] = None,
                    size: int = 1):
-
-            items = random.choices(domain.categories, k=size)
-            return items if len(items) > 1 else domain.cast(items[0])
+            if size == 1:
+                categories = domain._categories_tuple
+                return categories[int(
+                    len(categories) * np.random.random_sample())]
+            return self.sample_batch(domain, size)
+
+        def sample_batch(self, domain: "Categorical", size: int):
+            categories = domain._categories_tuple
+            indices = (len(categories) * np.random.random_sample(size)).astype(
+                int)
+            return [categories[i] for i in indices.tolist()]
 
     default_sampler_cls = _Uniform
+    # all but the first three are set by flaml.tune.space
+    __slots__ = ("_categories", "_categories_tuple", "_cat_set", "bounded",
+                 "const", "choice_cost", "choices", "ordered",
+                 "low_cost_point")
 
     def __init__(self, categories: Sequence):
-        self.categories = list(categories)
+        super().__init__()
+        self.categories = categories
+
+    @property
+    def categories(self) -> List:
+        return self._categories
+
+    @categories.setter
+    def categories(self, categories: Sequence):
+        self._categories = list(categories)
+        self._categories_tuple = tuple(self._categories)
+        self._domain_str = None
+        try:
+            self._cat_set = frozenset(self._categories)
+        except TypeError:
+            # unhashable categories, e.g., nested search spaces
+            self._cat_set = None
 
     def uniform(self):
-        new = copy(self)
+        new = self._clone()
         new.set_sampler(self._Uniform())
         return new
 
@@ -332,14 +553,32 @@ class Categorical(Domain):
         return self.categories[item]
 
     def is_valid(self, value: Any):
+        if self._cat_set is not None:
+            try:
+                return value in self._cat_set
+            except TypeError:
+                # unhashable value
+                pass
         return value in self.categories
 
+    def is_valid_batch(self, values: Sequence) -> np.ndarray:
+        categories = self._categories_tuple
+        if all(isinstance(c, (int, float)) for c in categories):
+            array = np.asarray(values)
+            if array.dtype.kind in "biuf":
+                return np.isin(array, categories)
+        return super().is_valid_batch(values)
+
     @property
     def domain_str(self):
-        return f"{self.categories}"
+        if self._domain_str is None:
+            self._domain_str = f"{self.categories}"
+        return self._domain_str
 
 
 class Quantized(Sampler):
+    __slots__ = ("sampler", "q")
+
     def __init__(self, sampler: Sampler, q: Union[float, int]):
         self.sampler = sampler
         self.q = q
@@ -353,11 +592,28 @@ class Quantized(Sampler):
                domain: Domain,
                spec: Optional[Union[List[Dict], Dict]] = None,
                size: int = 1):
-        values = self.sampler.sample(domain, spec, size)
-        quantized = np.round(np.divide(values, self.q)) * self.q
-        if not isinstance(quantized, np.ndarray):
-            return domain.cast(quantized)
-        return list(quantized)
+        if size == 1:
+            value = self.sampler.sample(domain, spec, size)
+            return domain._cast(round(value / self.q) * self.q)
+        return self.sample_batch(domain, size).tolist()
+
+    def sample_batch(self, domain: Domain, size: int):
+        values = self.sampler.sample_batch(domain, size)
+        if values.dtype.kind != "f":
+            values = values.astype(float)
+        kernel = get_quantize_kernel() \
+            if values.size >= _numba_quantize_min_size else None
+        if kernel is not None:
+            kernel(values, self.q)
+        else:
+            # quantize in place to avoid allocating a temporary per ufunc
+            np.divide(values, self.q, out=values)
+            np.round(values, out=values)
+            np.multiply(values, self.q, out=values)
+        if domain._cast is int:
+            # the quantized values are whole numbers
+            values = values.astype(int)
+        return values
 
 
 class PolynomialExpansionSet:
@@ -368,11 +624,49 @@ class PolynomialExpansionSet:
         self._highest_poly_order = highest_poly_order if \
             highest_poly_order is not None else len(self._init_monomials)
         self._allow_self_inter = allow_self_inter
+        self._monomial_masks = self._encode_monomials(self._init_monomials)
+
+    @staticmethod
+    def _encode_monomials(monomials) -> Optional[np.ndarray]:
+        try:
+            monomials = sorted(monomials)
+        except TypeError:
+            return None
+        if all(isinstance(m, str) for m in monomials):
+            # namespace strings: bit i is the i-th distinct character
+            features = {f: i for i, f in enumerate(
+                sorted(set("".join(monomials))))}
+            monomials = [[features[f] for f in m] for m in monomials]
+        elif not all(isinstance(m, tuple)
+                     and all(isinstance(i, int) for i in m)
+                     for m in monomials):
+            return None
+        masks = []
+        for monomial in monomials:
+            mask = 0
+            for i in monomial:
+                if not 0 <= i < 64 or mask >> i & 1:
+                    # a repeated feature (self interaction) has no bitmask
+                    return None
+                mask |= 1 << i
+            masks.append(mask)
+        return np.array(masks, dtype=np.uint64)
 
     @property
     def init_monomials(self):
         return self._init_monomials
 
+    @property
+    def monomial_masks(self) -> Optional[np.ndarray]:
+        """The init monomials in sorted order, each encoded as a uint64
+        bitmask of its features. A monomial is either a tuple of feature
+        indices, or a string of namespace characters, where bit i stands
+        for the i-th distinct character in sorted order. None if the
+        monomials cannot be encoded, e.g., when they repeat a feature or
+        involve more than 64 features.
+        """
+        return self._monomial_masks
+
     @property
     def highest_poly_order(self):
         return self._highest_poly_order
@@ -496,3 +790,74 @@ def polynomial_expansion_set(init_monomials: set, highest_poly_order: int = None
                              allow_self_inter: bool = False):
 
     return PolynomialExpansionSet(init_monomials, highest_poly_order, allow_self_inter)
+
+
+def sample_space(space: Dict, n: int) -> List[Dict]:
+    """Sample ``n`` configs from a search space with batched draws.
+    Instead of calling ``Domain.sample()`` once per domain and config, all
+    (log-)uniform ``Float`` and ``Integer`` domains and uniform
+    ``Categorical`` domains are drawn in one call per kind. Nested dicts
+    are sampled recursively, other domains via ``Domain.sample_batch()``,
+    and any other value is copied into every config as a constant.
+    Args:
+        space (dict): The search space, e.g., ``{"x": uniform(0, 1)}``.
+        n (int): The number of configs to sample.
+    Returns:
+        A list of ``n`` configs (dicts) with the same keys as ``space``.
+    """
+    columns = {}
+    continuous, integers, categoricals = [], [], []
+    for key, domain in space.items():
+        if isinstance(domain, dict):
+            columns[key] = sample_space(domain, n)
+            continue
+        if not isinstance(domain, Domain):
+            columns[key] = [domain] * n
+            continue
+        if domain.is_grid():
+            raise ValueError(
+                f"Cannot sample grid search parameter `{key}`.")
+        sampler = domain.get_sampler()
+        if isinstance(sampler, Float._Uniform):
+            continuous.append((key, domain.lower, domain.upper, None))
+        elif isinstance(sampler, (Float._LogUniform, Integer._LogUniform)):
+            log_lower, log_upper = sampler._log_range(domain)
+            continuous.append((key, log_lower, log_upper, type(domain)))
+        elif isinstance(sampler, Integer._Uniform):
+            integers.append((key, domain.lower, domain.upper))
+        elif isinstance(sampler, Categorical._Uniform):
+            categoricals.append((key, domain._categories_tuple))
+        else:
+            cast = domain._cast
+            columns[key] = [cast(value) for value in domain.sample_batch(n)]
+    if continuous:
+        keys, lows, highs, log_types = zip(*continuous)
+        lows, highs = np.array(lows), np.array(highs)
+        values = lows + (highs - lows) * np.random.random_sample((n, len(keys)))
+        for j, key in enumerate(keys):
+            column = values[:, j]
+            if log_types[j] is None:
+                columns[key] = column.tolist()
+            elif log_types[j] is Float:
+                columns[key] = np.exp(column).tolist()
+            else:
+                columns[key] = np.round(np.exp(column)).astype(int).tolist()
+    if integers:
+        keys, lows, highs = zip(*integers)
+        lows, highs = np.array(lows), np.array(highs)
+        values = ((highs - lows) * np.random.random_sample(
+            (n, len(keys)))).astype(int) + lows
+        for j, key in enumerate(keys):
+            columns[key] = values[:, j].tolist()
+    if categoricals:
+        keys, choices = zip(*categoricals)
+        indices = (np.array([len(c) for c in choices])
+                   * np.random.random_sample((n, len(keys)))).astype(int)
+        for j, key in enumerate(keys):
+            categories = choices[j]
+            columns[key] = [categories[i] for i in indices[:, j].tolist()]
+    if not columns:
+        return [{} for _ in range(n)]
+    keys = list(space.keys())
+    return [dict(zip(keys, row))
+            for row in zip(*(columns[key] for key in keys))]
@@ -1,12 +1,19 @@
 from flaml.tune.sample import (
-    BaseSampler, PolynomialExpansionSet, Domain,
+    BaseSampler, PolynomialExpansionSet, Domain, Float, Integer,
     uniform, quniform, choice, randint, qrandint, randn,
-    qrandn, loguniform, qloguniform, lograndint, qlograndint)
+    qrandn, loguniform, qloguniform, lograndint, qlograndint,
+    sample_space)
+import numpy as np
+import pytest
 
 
 def test_sampler():
     print(randn().sample(size=2))
     print(PolynomialExpansionSet(), BaseSampler())
+    assert PolynomialExpansionSet({"a", "bc"}).monomial_masks.tolist() == [
+        0b001, 0b110]
+    assert PolynomialExpansionSet({(0, 2)}).monomial_masks.tolist() == [0b101]
+    assert PolynomialExpansionSet({"aa"}).monomial_masks is None
     print(qrandn(2, 10, 2).sample(size=2))
     c = choice([1, 2])
     print(c.domain_str, len(c), c.is_valid(3))
@@ -16,3 +23,106 @@ def test_sampler():
     print(d.domain_str, d.is_function())
     d.default_sampler_cls = BaseSampler
     print(d.get_sampler())
+
+    class _ConstantSampler(BaseSampler):
+        def sample(self, domain, spec=None, size=1):
+            return domain.value
+
+    class _Constant(Domain):
+        default_sampler_cls = _ConstantSampler
+
+        # does not call Domain.__init__
+        def __init__(self, value):
+            self.value = value
+
+    d = _Constant(1)
+    assert d.sample() == 1 and not d.is_grid()
+    assert isinstance(d.get_sampler(), _ConstantSampler)
+    d = _Constant(2)
+    d.set_sampler(_ConstantSampler())
+    assert d._clone().sample() == 2
+    for lower, upper in [(None, None), (0, None)]:
+        with pytest.raises(ValueError):
+            Float(lower, upper).sample()
+    assert 0 <= Float(0, 1).sample() < 1
+    Integer(1, None)
+    for domain in [uniform(0, 1), loguniform(1, 10), randint(0, 2)]:
+        print(domain.sample(), domain.domain_str)
+        domain.lower, domain.upper = 4, 5
+        assert domain.is_valid_batch(domain.sample_batch(16)).all()
+        assert 4 <= domain.sample() <= 5
+        assert domain.domain_str == "(4, 5)"
+
+
+def test_scalar_sample_reproducible():
+    space = [uniform(-1, 1), loguniform(1e-4, 1), randint(1, 10),
+             lograndint(1, 1000), choice(["a", "b", "c"])]
+    samples = []
+    for _ in range(2):
+        np.random.seed(0)
+        samples.append([domain.sample() for domain in space]
+                       + [domain.sample(size=3).tolist() for domain in space[:4]])
+    assert samples[0] == samples[1]
+    for domain, value in zip(space, samples[0]):
+        assert domain.is_valid(value)
+
+
+def test_sample_batch():
+    for domain, kind in [(uniform(-1, 1), "f"), (quniform(0, 10, 2), "f"),
+                         (loguniform(1e-4, 1), "f"), (randint(1, 10), "i"),
+                         (qrandint(0, 10, 2), "i"), (lograndint(1, 1000), "i"),
+                         (qlograndint(5, 1000, 5), "i"), (randn(), "f")]:
+        values = domain.sample_batch(16)
+        assert isinstance(values, np.ndarray) and values.shape == (16,)
+        assert values.dtype.kind == kind
+        assert domain.is_valid_batch(values).all()
+        assert len(domain.sample(size=16)) == 16
+    values = choice(["a", "b", "c"]).sample_batch(16)
+    assert len(values) == 16 and set(values) <= {"a", "b", "c"}
+
+
+def test_quantize_kernel():
+    pytest.importorskip("numba")
+    from flaml.tune._numba_utils import get_quantize_kernel
+    # half-way values must round to even, as np.round does
+    values = np.concatenate([np.arange(-8, 8) + 0.5,
+                             np.random.uniform(-100, 100, 2000)])
+    for q in [0.1, 1, 3]:
+        quantized = values.copy()
+        get_quantize_kernel()(quantized, q)
+        assert np.array_equal(quantized, np.round(values / q) * q)
+    domain = quniform(0, 10, 2)
+    values = domain.sample_batch(4096)
+    assert domain.is_valid_batch(values).all() and (values % 2 == 0).all()
+
+
+def test_is_valid_batch():
+    values = [0, 1, 5, 10, 11]
+    for domain in [uniform(1, 10), randint(1, 10), choice([1, 5, 10])]:
+        mask = domain.is_valid_batch(values)
+        assert mask.tolist() == [domain.is_valid(v) for v in values]
+    domain = choice(["a", {"b": uniform(0, 1)}])
+    assert domain.is_valid_batch(["a", "c"]).tolist() == [True, False]
+    domain = choice([1, "a", (2, 3)])
+    assert domain.is_valid((2, 3)) and not domain.is_valid([2, 3])
+
+
+def test_sample_space():
+    space = {
+        "x": uniform(-1, 1), "lr": loguniform(1e-4, 1),
+        "n": randint(1, 10), "m": lograndint(1, 1000),
+        "q": quniform(0, 10, 2), "c": choice(["a", "b"]),
+        "nested": {"y": qrandint(0, 9, 3)}, "const": 5,
+    }
+    configs = sample_space(space, 20)
+    assert len(configs) == 20
+    for config in configs:
+        assert list(config) == list(space)
+        for key, domain in space.items():
+            if key == "nested":
+                assert space[key]["y"].is_valid(config[key]["y"])
+            elif key == "const":
+                assert config[key] == 5
+            else:
+                assert domain.is_valid(config[key])
+        assert isinstance(config["n"], int) and isinstance(config["m"], int)